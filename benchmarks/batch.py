@@ -0,0 +1,98 @@
+"""
+--- BENCHMARK: BATCH VS SEPARATE CALLS ---
+Simulates one frontend screen: 20 'GET /api/v1/notes/{note_id}' calls plus
+3 PATCHes, issued either one by one or as a single 'POST /api/v1/batch'.
+
+By default the app runs in-process (TestClient) against a throwaway database,
+which measures framework + session overhead but not network latency. Pass
+'--base-url http://127.0.0.1:8000' to benchmark a running server instead
+(it must already contain the notes with ids 1..20).
+
+Usage:
+    uv run python benchmarks/batch.py --rounds 50
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+GET_IDS = list(range(1, 21))
+PATCH_IDS = [1, 2, 3]
+
+
+def separate_calls(client: httpx.Client) -> None:
+    for note_id in GET_IDS:
+        client.get(f"/api/v1/notes/{note_id}").raise_for_status()
+    for note_id in PATCH_IDS:
+        client.patch(f"/api/v1/notes/{note_id}", json={"priority": 1 + note_id % 5}).raise_for_status()
+
+
+def batched_call(client: httpx.Client) -> None:
+    operations: list[dict[str, Any]] = [{"op": "get", "ids": GET_IDS}]
+    operations += [{"op": "update", "id": note_id, "data": {"priority": 1 + note_id % 5}} for note_id in PATCH_IDS]
+    response = client.post("/api/v1/batch", json={"operations": operations})
+    response.raise_for_status()
+    assert all(result["status"] < 400 for result in response.json()["results"])
+
+
+def measure(scenario: Callable[[httpx.Client], None], client: httpx.Client, rounds: int) -> float:
+    """
+    Returns the median wall time of one scenario, in milliseconds.
+    """
+    scenario(client)  # warm-up
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        scenario(client)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def run(client: httpx.Client, rounds: int) -> None:
+    separate_ms = measure(separate_calls, client, rounds)
+    batched_ms = measure(batched_call, client, rounds)
+    calls = len(GET_IDS) + len(PATCH_IDS)
+    print(f"separate ({calls} requests): {separate_ms:.1f} ms")
+    print(f"batched  (1 request):   {batched_ms:.1f} ms")
+    print(f"speedup: {separate_ms / batched_ms:.1f}x")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare POST /api/v1/batch with separate note calls")
+    parser.add_argument("--rounds", type=int, default=30, help="measured repetitions per scenario")
+    parser.add_argument("--base-url", default=None, help="benchmark a running server instead of an in-process app")
+    args = parser.parse_args()
+
+    if args.base_url:
+        with httpx.Client(base_url=args.base_url) as client:
+            run(client, args.rounds)
+        return 0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # The database URL is read at import time, so set it before importing the app.
+        os.environ["DATABASE_URL"] = f"sqlite:///{Path(tmp) / 'bench.db'}"
+        os.chdir(PROJECT_ROOT)
+        sys.path.insert(0, str(PROJECT_ROOT))
+        from fastapi.testclient import TestClient
+
+        from main import app
+
+        with TestClient(app) as client:
+            for note_id in GET_IDS:
+                client.post("/api/v1/notes/", json={"title": f"Note {note_id}", "category_id": 1}).raise_for_status()
+            run(client, args.rounds)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+"""
+--- BENCHMARK: COLD START ---
+Measures how long a fresh worker needs before it can serve traffic:
+1. 'import_ms': time to import 'main' (FastAPI, SQLModel, our routers...).
+2. 'first_request_ms': time from process start until the first
+   'GET /api/v1/notes/' has been answered (imports + lifespan + request).
+
+Every run happens in a brand new Python process, because imports are cached
+per process and a warm process would hide exactly what we want to measure.
+The first run uses an empty database (so 'init_db' has to create the schema);
+the following runs reuse it, like a worker joining an already running service.
+
+Usage:
+    uv run python benchmarks/startup.py --runs 7
+It exits with status 1 if a median goes over its threshold or if an optional
+subsystem (like the AIService) got imported during startup.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Modules that must NOT be imported just to start the app.
+LAZY_MODULES = ["src.services.ai_service"]
+
+# This script runs inside the child process.
+PROBE = """
+import json
+import sys
+import time
+
+start = time.perf_counter()
+import main
+imported = time.perf_counter()
+
+from fastapi.testclient import TestClient
+
+with TestClient(main.app) as client:
+    response = client.get("/api/v1/notes/")
+    answered = time.perf_counter()
+
+print(json.dumps({
+    "import_ms": (imported - start) * 1000,
+    "first_request_ms": (answered - start) * 1000,
+    "status_code": response.status_code,
+    "loaded": [name for name in LAZY_MODULES if name in sys.modules],
+}))
+"""
+
+
+def run_probe(database_url: str) -> dict[str, Any]:
+    """
+    Starts a fresh interpreter, runs the probe and returns its measurements.
+    """
+    env = {**os.environ, "DATABASE_URL": database_url}
+    code = f"LAZY_MODULES = {LAZY_MODULES!r}\n{PROBE}"
+    completed = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=PROJECT_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    result: dict[str, Any] = json.loads(completed.stdout.strip().splitlines()[-1])
+    return result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Cold start benchmark for main:app")
+    parser.add_argument("--runs", type=int, default=5, help="number of fresh processes to start")
+    parser.add_argument("--max-import-ms", type=float, default=1500.0, help="regression threshold for the import median")
+    parser.add_argument(
+        "--max-first-request-ms", type=float, default=2500.0, help="regression threshold for the time-to-first-request median"
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = f"sqlite:///{Path(tmp) / 'bench.db'}"
+        results = [run_probe(database_url) for _ in range(args.runs)]
+
+    failures: list[str] = []
+    for index, result in enumerate(results):
+        label = "empty db" if index == 0 else "existing db"
+        print(
+            f"run {index + 1} ({label}): import {result['import_ms']:.1f} ms, "
+            f"first request {result['first_request_ms']:.1f} ms, status {result['status_code']}"
+        )
+        if result["status_code"] != 200:
+            failures.append(f"run {index + 1} answered with status {result['status_code']}")
+        if result["loaded"]:
+            failures.append(f"run {index + 1} imported lazy modules at startup: {result['loaded']}")
+
+    # The first run pays for creating the schema, so it is reported but not
+    # included in the medians we compare against the thresholds.
+    steady = results[1:] or results
+    import_median = statistics.median(result["import_ms"] for result in steady)
+    first_request_median = statistics.median(result["first_request_ms"] for result in steady)
+    print(f"median import: {import_median:.1f} ms (threshold {args.max_import_ms:.0f} ms)")
+    print(f"median first request: {first_request_median:.1f} ms (threshold {args.max_first_request_ms:.0f} ms)")
+
+    if import_median > args.max_import_ms:
+        failures.append("import time regressed")
+    if first_request_median > args.max_first_request_ms:
+        failures.append("time-to-first-request regressed")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,9 +4,11 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.responses import RedirectResponse
 from fastapi.staticfiles import StaticFiles
+from sqlmodel import Session
 
 from src.api.v1.router import api_router
-from src.core.database import init_db
+from src.core.database import engine, init_db
+from src.services.note_counter_service import NoteCounterService
 
 
 # --- TEACHING: THE LIFESPAN EVENT HANDLER ---
@@ -21,13 +23,16 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """
     # --- TIP: DATABASE REGISTRATION ---
     # SQLModel requires models to be imported before calling 'create_all'.
-    # We import the Note model here to ensure it is registered with the
-    # SQLModel metadata, allowing 'init_db' to create the table.
-    from src.models.note import Note  # noqa: F401
-
-    # Initialize database tables
+    # 'src.core.database' registers them itself, so no import is needed here.
+    # Heavy optional subsystems (like the AIService) must NOT be loaded at
+    # startup; 'benchmarks/startup.py' fails if one of them gets imported.
     init_db()
 
+    # The counter table is empty on a fresh database, or right after it was
+    # added to an existing one. Either way, build the counters from the notes.
+    with Session(engine) as session:
+        NoteCounterService(session).reconcile_if_empty()
+
     # The 'yield' statement separates startup logic from shutdown logic.
     # Everything before 'yield' runs on STARTUP.
     # Everything after 'yield' runs on SHUTDOWN.
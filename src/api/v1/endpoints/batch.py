@@ -0,0 +1,33 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
+from sqlmodel import Session
+
+from src.core.database import get_session
+from src.schemas.batch import BatchRequest, BatchResponse
+from src.services.batch_service import BatchService
+from src.services.note_service import NoteService
+
+router = APIRouter()
+
+
+def get_batch_service(session: Annotated[Session, Depends(get_session)]) -> BatchService:
+    """
+    Provides a BatchService sharing ONE database session for the whole batch.
+    """
+    return BatchService(NoteService(session))
+
+
+BatchServiceDep = Annotated[BatchService, Depends(get_batch_service)]
+
+
+# --- TEACHING: BATCH ENDPOINT ---
+# One HTTP round trip, one session, one transaction for the writes and one
+# query for the reads. The response always has status 200; each operation
+# reports its own status code in its result, just like separate calls would.
+@router.post("/batch", response_model=BatchResponse)
+def run_batch(batch: BatchRequest, service: BatchServiceDep) -> BatchResponse:
+    """
+    Execute many note operations (get, create, update, delete) in one request.
+    """
+    return service.execute(batch)
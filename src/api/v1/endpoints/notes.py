@@ -1,12 +1,12 @@
 from collections.abc import Sequence
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 from sqlmodel import Session
 
 from src.core.database import get_session
 from src.models.note import Note
-from src.schemas.note import NoteCreate, NoteResponse, NoteUpdate
+from src.schemas.note import NoteCountResponse, NoteCreate, NoteResponse, NoteUpdate
 from src.services.note_service import NoteService
 
 # --- concept: THE API ROUTER ---
@@ -59,6 +59,7 @@ def create_note(note_data: NoteCreate, service: NoteServiceDep) -> Note:
 # Native Pagination available in cleaner manners in 3rd party libraries but it's not always the best choice or our focus now.
 @router.get("/", response_model=Sequence[NoteResponse])
 def read_notes(
+    response: Response,
     service: NoteServiceDep,
     offset: int = Query(default=0, ge=0),
     limit: int = Query(default=10, le=100),
@@ -68,10 +69,31 @@ def read_notes(
     Notice we return a 'Sequence[Note]' (the database models), but FastAPI
     automatically filters them through 'NoteResponse' (the schema) before
     sending the JSON to the client hmm so what is the purpose of this?
+
+    The 'X-Total-Count' header tells the UI how many notes exist in total,
+    so it can render the pagination without a second request.
     """
+    response.headers["X-Total-Count"] = str(service.count_notes())
     return service.get_notes(offset=offset, limit=limit)
 
 
+# --- TEACHING: ROUTE ORDER ---
+# This route MUST be declared before '/{note_id}', otherwise FastAPI would try
+# to parse "count" as a note id and answer with a 422 validation error.
+@router.get("/count", response_model=NoteCountResponse)
+def count_notes(
+    service: NoteServiceDep,
+    category_id: int | None = Query(default=None),
+    priority: int | None = Query(default=None, gt=0, lt=6),
+) -> NoteCountResponse:
+    """
+    Returns how many notes match the optional filters, served from the
+    maintained counters instead of a 'COUNT(*)' table scan.
+    """
+    count = service.count_notes(category_id=category_id, priority=priority)
+    return NoteCountResponse(count=count, category_id=category_id, priority=priority)
+
+
 # --- TEACHING: GET (READ ONE) ---
 # The '{note_id}' in the path is a variable. FastAPI extracts it from the
 # URL and passes it to our function as an argument.
@@ -1,6 +1,6 @@
 from fastapi import APIRouter
 
-from src.api.v1.endpoints import notes
+from src.api.v1.endpoints import batch, notes
 
 # --- TEACHING: THE ROUTER AGGREGATOR ---
 # In a large-scale application, you will have many different modules
@@ -16,3 +16,7 @@ api_router = APIRouter()
 # 2. 'tags=["notes"]': This groups these endpoints together in the Swagger UI,
 #    making it much easier for other developers to navigate.
 api_router.include_router(notes.router, prefix="/notes", tags=["notes"])
+
+# The batch endpoint lives at '/api/v1/batch' (no extra prefix) and multiplexes
+# many note operations into a single request.
+api_router.include_router(batch.router, tags=["batch"])
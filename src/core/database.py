@@ -1,7 +1,15 @@
+import os
 from collections.abc import Generator
 
 from sqlmodel import Session, SQLModel, create_engine
 
+# --- TIP: MODEL REGISTRATION ---
+# SQLModel only knows about a table once its class has been imported.
+# Importing the models package here (instead of somewhere inside the app
+# lifespan) guarantees the metadata is complete before 'init_db' runs.
+import src.models.note  # noqa: F401
+import src.models.note_counter  # noqa: F401
+
 # --- TEACHING: DATABASE CONFIGURATION ---
 # We use SQLite as our primary database because it is a file-based database
 # No Server required
@@ -10,7 +18,9 @@ from sqlmodel import Session, SQLModel, create_engine
 # either sqlite or sqlmodel requires zero configuration, making it perfect for development phase.
 # The URL "sqlite:///./database.db" tells SQLModel to create a file named
 # 'database.db' in the current project directory.
-DATABASE_URL = "sqlite:///./database.db"
+# It can be overridden with the 'DATABASE_URL' environment variable (the
+# startup benchmark uses this to point at a throwaway database).
+DATABASE_URL = os.environ.get("DATABASE_URL", "sqlite:///./database.db")
 
 # --- TIP: ENGINE CREATION ---
 # The 'engine' is the bridge between Python and the database file.
@@ -18,7 +28,9 @@ DATABASE_URL = "sqlite:///./database.db"
 # prevents multiple threads from using the same connection. FastAPI handles
 # requests in multiple threads, so we disable this check to allow concurrent access.
 # we already had a deep conversation about this before.
-engine = create_engine(DATABASE_URL, echo=False, connect_args={"check_same_thread": False})
+# Other databases (e.g. PostgreSQL via 'DATABASE_URL') don't know this option.
+connect_args = {"check_same_thread": False} if DATABASE_URL.startswith("sqlite") else {}
+engine = create_engine(DATABASE_URL, echo=False, connect_args=connect_args)
 
 
 def init_db() -> None:
@@ -31,6 +43,28 @@ def init_db() -> None:
     SQLModel.metadata.create_all(engine)
 
 
+def begin_write(session: Session) -> None:
+    """
+    TIP: TAKE THE WRITE LOCK BEFORE YOU READ
+    pysqlite only sends 'BEGIN' right before the first INSERT/UPDATE/DELETE, so
+    the SELECT that precedes a write runs outside any transaction, and two
+    requests can read the same row before either one writes it.
+    On SQLite, 'BEGIN IMMEDIATE' takes the database write lock right away.
+    Other writers wait until we commit; readers are not blocked.
+    If the connection is already inside a transaction, pysqlite opened it for a
+    write, so the lock is already held.
+    Other databases open the transaction on the first statement, so there is
+    nothing to do here; lock rows with 'SELECT ... FOR UPDATE' instead.
+    """
+    connection = session.connection()
+    if connection.dialect.name != "sqlite":
+        return
+    driver_connection = connection.connection.driver_connection
+    if driver_connection is not None and driver_connection.in_transaction:
+        return
+    connection.exec_driver_sql("BEGIN IMMEDIATE")
+
+
 def get_session() -> Generator[Session, None, None]:
     """
     TEACHING: SESSION MANAGEMENT (DEPENDENCY INJECTION) "VIP CONCEPT" PLEASE UNDERSTAND DEEEEPLY!!.
@@ -0,0 +1,20 @@
+from sqlmodel import Field, SQLModel
+
+
+class NoteCounter(SQLModel, table=True):
+    """
+    --- CONCEPT: INCREMENTALLY MAINTAINED COUNTS ---
+    'SELECT COUNT(*)' has to walk the whole 'note' table every single time.
+    Instead we keep one small row per "bucket" and bump it whenever a note is
+    created, moved or deleted, inside the same transaction as the note itself.
+
+    A bucket is identified by (scope, key):
+    - ("total", "")                      -> every note
+    - ("category", "3")                  -> notes with category_id=3
+    - ("priority", "5")                  -> notes with priority=5
+    - ("category_priority", "3:5")       -> both filters at once
+    """
+
+    scope: str = Field(primary_key=True, max_length=32)
+    key: str = Field(default="", primary_key=True, max_length=32)
+    count: int = Field(default=0)
@@ -0,0 +1,87 @@
+from typing import Annotated, Literal
+
+from pydantic import BaseModel, Field
+
+from src.schemas.note import NoteCreate, NoteResponse, NoteUpdate
+
+
+# --- CONCEPT: DISCRIMINATED UNIONS ---
+# Every sub-operation carries an 'op' field. Pydantic looks at it first and
+# then validates the rest of the object against the matching schema, so a
+# "delete" never gets confused with an "update" research "tagged unions".
+class BatchGet(BaseModel):
+    op: Literal["get"]
+    ids: list[int] = Field(..., min_length=1, max_length=100)
+
+
+class BatchCreate(BaseModel):
+    op: Literal["create"]
+    data: NoteCreate
+
+
+class BatchUpdate(BaseModel):
+    op: Literal["update"]
+    id: int
+    data: NoteUpdate
+
+
+class BatchDelete(BaseModel):
+    op: Literal["delete"]
+    id: int
+
+
+BatchOperation = Annotated[BatchGet | BatchCreate | BatchUpdate | BatchDelete, Field(discriminator="op")]
+
+
+class BatchRequest(BaseModel):
+    """
+    --- TEACHING: BATCH REQUEST SCHEMA ---
+    A list of sub-operations executed in a single HTTP round trip.
+    The limit keeps one request from turning into an unbounded amount of work.
+
+    ORDER RULE: operations behave as if they ran one by one, in list order.
+    A get sees the creates, updates and deletes listed before it, and none of
+    those listed after it. Writes are all-or-nothing: if one fails, every
+    write is rolled back and all gets see the notes as they were before.
+    In the example, the first get sees notes 2 and 3 unchanged, while the last
+    get sees note 2 with priority 5 and reports note 3 as missing.
+    """
+
+    operations: list[BatchOperation] = Field(..., min_length=1, max_length=100)
+
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "operations": [
+                    {"op": "get", "ids": [1, 2, 3]},
+                    {"op": "create", "data": {"title": "Grocery List", "priority": 3, "category_id": 1}},
+                    {"op": "update", "id": 2, "data": {"priority": 5}},
+                    {"op": "delete", "id": 3},
+                    {"op": "get", "ids": [2, 3]},
+                ]
+            }
+        }
+    }
+
+
+class BatchResult(BaseModel):
+    """
+    --- TEACHING: PER-OPERATION RESULT ---
+    'index' points back to the position of the operation in the request and
+    'status' is the HTTP status code that operation would have had on its own.
+    - get:           'notes' (found notes, in request order) and 'missing' ids.
+    - create/update: 'note'.
+    - delete:        'detail' with the success message.
+    """
+
+    index: int
+    op: str
+    status: int
+    note: NoteResponse | None = None
+    notes: list[NoteResponse] | None = None
+    missing: list[int] | None = None
+    detail: str | None = None
+
+
+class BatchResponse(BaseModel):
+    results: list[BatchResult]
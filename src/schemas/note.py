@@ -53,7 +53,7 @@ class NoteUpdate(BaseModel):
 
     title: str | None = Field(None, min_length=1, max_length=100)
     description: str | None = Field(None, max_length=5000)
-    priority: int | None = Field(None,lt=6,gt=0,default=1)
+    priority: int | None = Field(None, lt=6, gt=0)
     category_id: int | None = None
 
 
@@ -88,3 +88,15 @@ class NoteResponse(NoteBase):
     # (like SQLModel instances) and convert them into JSON-compatible
     # dictionaries automatically.
     model_config = ConfigDict(from_attributes=True)
+
+
+class NoteCountResponse(BaseModel):
+    """
+    --- TEACHING: COUNT SCHEMA ---
+    Returned by 'GET /notes/count'. The filters are echoed back so the
+    client knows exactly which count it received.
+    """
+
+    count: int
+    category_id: int | None = None
+    priority: int | None = None
@@ -0,0 +1,144 @@
+from fastapi import HTTPException
+from sqlalchemy.exc import IntegrityError
+
+from src.schemas.batch import (
+    BatchCreate,
+    BatchDelete,
+    BatchGet,
+    BatchRequest,
+    BatchResponse,
+    BatchResult,
+    BatchUpdate,
+)
+from src.schemas.note import NoteResponse
+from src.services.note_service import NoteService
+
+
+class _BatchAbortedError(Exception):
+    """
+    Raised inside the write transaction to roll it back, remembering which
+    operation failed and why.
+    """
+
+    def __init__(self, index: int, status: int, detail: str) -> None:
+        super().__init__(detail)
+        self.index = index
+        self.status = status
+        self.detail = detail
+
+
+class BatchService:
+    """
+    --- CONCEPT: REQUEST MULTIPLEXING ---
+    Instead of 20 HTTP requests (each with its own session and round trip), the
+    client sends one list of operations and we execute them together:
+    1. All gets are collapsed into ONE 'WHERE id IN (...)' query, executed
+       BEFORE the writes, under the write lock and in the same transaction.
+    2. All writes (create/update/delete) run in order, in ONE transaction,
+       through the NoteService. If one fails, none of them are kept.
+    3. The results are replayed in request order: every get sees the writes
+       that come before it in the batch, and none of those after it.
+    """
+
+    def __init__(self, note_service: NoteService) -> None:
+        self.notes = note_service
+
+    def execute(self, request: BatchRequest) -> BatchResponse:
+        operations = list(enumerate(request.operations))
+        gets = [(index, op) for index, op in operations if isinstance(op, BatchGet)]
+        writes = [(index, op) for index, op in operations if not isinstance(op, BatchGet)]
+
+        results: dict[int, BatchResult] = {}
+        effects: dict[int, tuple[int, NoteResponse | None]] = {}
+        snapshot: dict[int, NoteResponse] = {}
+        try:
+            with self.notes.transaction():
+                # TIP: SNAPSHOT UNDER THE WRITE LOCK
+                # When the batch writes, the snapshot is read with the write lock
+                # held, in the same transaction as the writes. No other request
+                # can commit between our read and our writes.
+                snapshot = self._load_snapshot(gets, lock=bool(writes))
+                self._run_writes(writes, results, effects)
+        except _BatchAbortedError as aborted:
+            # TIP: ALL OR NOTHING
+            # The transaction was rolled back, so no write of this batch was kept
+            # and every get sees the notes as they were before the batch.
+            # Tell the client which one failed and that the others were undone.
+            effects.clear()
+            for index, write in writes:
+                if index == aborted.index:
+                    results[index] = BatchResult(index=index, op=write.op, status=aborted.status, detail=aborted.detail)
+                else:
+                    detail = f"Rolled back because operation {aborted.index} failed"
+                    results[index] = BatchResult(index=index, op=write.op, status=424, detail=detail)
+
+        # TIP: REPLAY IN ORDER
+        # 'effects' holds what each committed write did to a note (None for a
+        # delete). Applying them one by one moves the snapshot forward in time.
+        for index, op in operations:
+            if index in effects:
+                note_id, note = effects[index]
+                if note is None:
+                    snapshot.pop(note_id, None)
+                else:
+                    snapshot[note_id] = note
+            elif isinstance(op, BatchGet):
+                results[index] = self._get_result(index, op, snapshot)
+
+        return BatchResponse(results=[results[index] for index, _ in operations])
+
+    def _load_snapshot(self, gets: list[tuple[int, BatchGet]], lock: bool) -> dict[int, NoteResponse]:
+        """
+        One query for every id any get asks for, taken before the writes run.
+        """
+        wanted = sorted({note_id for _, op in gets for note_id in op.ids})
+        if not wanted:
+            return {}
+        notes = self.notes.get_notes_by_ids(wanted, for_update=lock)
+        return {note.id: NoteResponse.model_validate(note) for note in notes if note.id is not None}
+
+    def _run_writes(
+        self,
+        writes: list[tuple[int, BatchCreate | BatchUpdate | BatchDelete]],
+        results: dict[int, BatchResult],
+        effects: dict[int, tuple[int, NoteResponse | None]],
+    ) -> None:
+        """
+        Runs the writes in order, recording each result and its effect on the
+        note it touched. The first failure aborts (and rolls back) the batch.
+        """
+        for index, op in writes:
+            try:
+                results[index], effects[index] = self._run_write(index, op)
+            except HTTPException as exc:
+                raise _BatchAbortedError(index, exc.status_code, str(exc.detail)) from exc
+            except IntegrityError as exc:
+                raise _BatchAbortedError(index, 409, "Operation violates a database constraint") from exc
+
+    def _run_write(
+        self, index: int, op: BatchCreate | BatchUpdate | BatchDelete
+    ) -> tuple[BatchResult, tuple[int, NoteResponse | None]]:
+        """
+        The response is built right away (inside the transaction) so we don't
+        reload every note from the database after the commit expires it.
+        """
+        if isinstance(op, BatchCreate):
+            note = NoteResponse.model_validate(self.notes.create_note(op.data))
+            return BatchResult(index=index, op=op.op, status=201, note=note), (note.id, note)
+        if isinstance(op, BatchUpdate):
+            note = NoteResponse.model_validate(self.notes.update_note(op.id, op.data))
+            return BatchResult(index=index, op=op.op, status=200, note=note), (note.id, note)
+        message = self.notes.delete_note(op.id)["message"]
+        return BatchResult(index=index, op=op.op, status=200, detail=message), (op.id, None)
+
+    def _get_result(self, index: int, op: BatchGet, snapshot: dict[int, NoteResponse]) -> BatchResult:
+        notes = [snapshot[note_id] for note_id in op.ids if note_id in snapshot]
+        missing = [note_id for note_id in op.ids if note_id not in snapshot]
+        return BatchResult(
+            index=index,
+            op=op.op,
+            status=404 if missing else 200,
+            notes=notes,
+            missing=missing,
+            detail="Note not found" if missing else None,
+        )
@@ -0,0 +1,187 @@
+from collections import Counter
+from collections.abc import Callable
+from typing import Any
+
+from sqlalchemy import func
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlmodel import Session, col, select
+
+from src.core.database import begin_write
+from src.models.note import Note
+from src.models.note_counter import NoteCounter
+
+TOTAL = "total"
+CATEGORY = "category"
+PRIORITY = "priority"
+CATEGORY_PRIORITY = "category_priority"
+
+Bucket = tuple[str, str]
+
+# --- TIP: DIALECT-SPECIFIC UPSERT ---
+# 'INSERT ... ON CONFLICT DO UPDATE' is not part of standard SQL, so SQLAlchemy
+# ships it per dialect. These are the databases whose 'insert' supports it.
+UpsertInsert = Callable[[Any], sqlite.Insert | postgresql.Insert]
+_UPSERT_INSERTS: dict[str, UpsertInsert] = {
+    "sqlite": sqlite.insert,
+    "postgresql": postgresql.insert,
+}
+
+
+def upsert_insert_for(dialect_name: str) -> UpsertInsert:
+    """
+    Returns the 'insert' construct with 'on_conflict_do_update' for this database.
+    Unsupported databases fail right away (the app builds a NoteCounterService
+    at startup), instead of on the first note write.
+    """
+    try:
+        return _UPSERT_INSERTS[dialect_name]
+    except KeyError:
+        supported = ", ".join(sorted(_UPSERT_INSERTS))
+        raise RuntimeError(f"Note counters need an upsert; supported databases: {supported} (got {dialect_name!r})") from None
+
+
+def note_buckets(category_id: int, priority: int) -> list[Bucket]:
+    """
+    Every counter row a note with these values contributes to.
+    """
+    return [
+        (TOTAL, ""),
+        (CATEGORY, str(category_id)),
+        (PRIORITY, str(priority)),
+        (CATEGORY_PRIORITY, f"{category_id}:{priority}"),
+    ]
+
+
+class NoteCounterService:
+    """
+    --- CONCEPT: COUNTER SERVICE ---
+    Keeps the 'NoteCounter' rows in sync with the 'note' table.
+    It never commits by itself: the NoteService calls it right before its own
+    commit, so the note and its counters are saved (or rolled back) together.
+    """
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+        self._insert = upsert_insert_for(session.get_bind().dialect.name)
+
+    def note_created(self, note: Note) -> None:
+        self._apply(Counter(note_buckets(note.category_id, note.priority)))
+
+    def note_deleted(self, note: Note) -> None:
+        self._apply(Counter(dict.fromkeys(note_buckets(note.category_id, note.priority), -1)))
+
+    def note_moved(self, old: tuple[int, int], new: tuple[int, int]) -> None:
+        """
+        A note changed its category and/or priority. The "total" bucket
+        cancels out, so only the filtered buckets are touched.
+        """
+        deltas = Counter(note_buckets(*new))
+        deltas.subtract(note_buckets(*old))
+        self._apply(deltas)
+
+    def _apply(self, deltas: Counter[Bucket]) -> None:
+        """
+        TEACHING: UPSERT
+        'INSERT ... ON CONFLICT DO UPDATE' creates the bucket the first time
+        we see it and atomically adds the delta afterwards, in one statement.
+        """
+        rows = [{"scope": scope, "key": key, "count": delta} for (scope, key), delta in deltas.items() if delta]
+        if not rows:
+            return
+        statement = self._insert(NoteCounter).values(rows)
+        statement = statement.on_conflict_do_update(
+            index_elements=["scope", "key"],
+            set_={"count": NoteCounter.count + statement.excluded.count},
+        )
+        self.session.exec(statement)
+
+    def get_count(self, category_id: int | None = None, priority: int | None = None) -> int:
+        """
+        Reads a single counter row by primary key, whatever the filters are.
+        """
+        if category_id is not None and priority is not None:
+            bucket: Bucket = (CATEGORY_PRIORITY, f"{category_id}:{priority}")
+        elif category_id is not None:
+            bucket = (CATEGORY, str(category_id))
+        elif priority is not None:
+            bucket = (PRIORITY, str(priority))
+        else:
+            bucket = (TOTAL, "")
+        counter = self.session.get(NoteCounter, bucket)
+        return counter.count if counter else 0
+
+    def reconcile_if_empty(self) -> bool:
+        """
+        Seeds the counters from the 'note' table when no counter row exists yet.
+        Returns True when a reconciliation ran.
+        """
+        if self.session.exec(select(NoteCounter).limit(1)).first() is not None:
+            return False
+        self.reconcile()
+        return True
+
+    def _lock_note_writes(self) -> None:
+        """
+        TIP: READ-THEN-WRITE NEEDS A LOCK
+        pysqlite only opens a transaction at the first INSERT/UPDATE/DELETE, so
+        a plain SELECT would read outside of it. 'BEGIN IMMEDIATE' takes SQLite's
+        write lock right away. On PostgreSQL, SHARE ROW EXCLUSIVE on 'note' blocks
+        other writers (but not readers) until we commit. Unlike SHARE, it also
+        conflicts with itself, so two workers seeding the counters at startup
+        run one after the other, and the second one sees the first one's rows.
+        """
+        connection = self.session.connection()
+        if connection.dialect.name == "sqlite":
+            begin_write(self.session)
+        else:
+            connection.exec_driver_sql("LOCK TABLE note IN SHARE ROW EXCLUSIVE MODE")
+
+    def reconcile(self) -> dict[Bucket, tuple[int, int]]:
+        """
+        TEACHING: RECONCILIATION (DRIFT REPAIR)
+        Counters can drift if someone edits the table by hand or the counter
+        table is added to an existing database. This recomputes every bucket
+        with one GROUP BY query, overwrites the rows that are wrong and
+        commits. It returns the drift as {bucket: (stored, actual)}.
+
+        The counters are overwritten with absolute values, so no note may be
+        written between the GROUP BY and the commit. That is why we lock note
+        writes first.
+        """
+        self._lock_note_writes()
+        actual: Counter[Bucket] = Counter()
+        statement = select(Note.category_id, Note.priority, func.count()).group_by(col(Note.category_id), col(Note.priority))
+        for category_id, priority, count in self.session.exec(statement):
+            for bucket in note_buckets(category_id, priority):
+                actual[bucket] += count
+        # The total bucket should exist even when there are no notes at all.
+        actual.setdefault((TOTAL, ""), 0)
+
+        stored = {(row.scope, row.key): row for row in self.session.exec(select(NoteCounter))}
+        drift: dict[Bucket, tuple[int, int]] = {}
+        for bucket in stored.keys() | actual.keys():
+            row = stored.get(bucket)
+            if row is None:
+                row = NoteCounter(scope=bucket[0], key=bucket[1], count=0)
+                self.session.add(row)
+            if row.count != actual[bucket]:
+                drift[bucket] = (row.count, actual[bucket])
+                row.count = actual[bucket]
+                self.session.add(row)
+
+        self.session.commit()
+        return drift
+
+
+# --- TIP: RECONCILIATION JOB ---
+# Run it from cron (or by hand) to detect and repair drift:
+#     uv run python -m src.services.note_counter_service
+if __name__ == "__main__":
+    from src.core.database import engine, init_db
+
+    init_db()
+    with Session(engine) as session:
+        repaired = NoteCounterService(session).reconcile()
+    for (scope, key), (stored_count, actual_count) in sorted(repaired.items()):
+        print(f"{scope}[{key}]: stored={stored_count} actual={actual_count} -> repaired")
+    print(f"{len(repaired)} counter(s) repaired")
@@ -1,11 +1,14 @@
-from collections.abc import Sequence
+from collections.abc import Generator, Sequence
+from contextlib import contextmanager
 from datetime import datetime
 
 from fastapi import HTTPException
-from sqlmodel import Session, select
+from sqlmodel import Session, col, select
 
+from src.core.database import begin_write
 from src.models.note import Note
 from src.schemas.note import NoteCreate, NoteUpdate
+from src.services.note_counter_service import NoteCounterService
 
 
 class NoteService:
@@ -26,23 +29,57 @@ class NoteService:
         swap the session for a "Mock" session during unit testing.
         """
         self.session = session
+        self.counters = NoteCounterService(session)
+        self._autocommit = True
+
+    @contextmanager
+    def transaction(self) -> Generator[None, None, None]:
+        """
+        TEACHING: ONE TRANSACTION FOR MANY WRITES
+        Normally every write method commits on its own. Inside this block the
+        methods only 'flush' (send the SQL without committing), and everything
+        is committed once at the end, or rolled back together if anything fails.
+        """
+        self._autocommit = False
+        try:
+            yield
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+        finally:
+            self._autocommit = True
+
+    def _save(self) -> None:
+        """
+        Commits right away, unless we are inside 'transaction()'.
+        """
+        if self._autocommit:
+            self.session.commit()
+        else:
+            self.session.flush()
 
     def create_note(self, note_data: NoteCreate) -> Note:
         """
         NOTE LIFE CYCLE : CREATING DATA
         1. Transform Schema (NoteCreate) into a Model (Note).
         2. 'self.session.add(db_note)': Tell the session to track this object.
-        3. 'self.session.commit()': Save the changes to the database file.
-        4. 'self.session.refresh(db_note)': Pull the latest data from the DB
+        3. Bump the counters in the same transaction as the note.
+        4. 'self._save()': Save the changes to the database file (a commit,
+           unless we are inside 'transaction()').
+        5. 'self.session.refresh(db_note)': Pull the latest data from the DB
            back into ou object to populate generated fields like 'id'.
         """
         db_note = Note(
             title=note_data.title,
             description=note_data.description,
+            priority=note_data.priority,
+            category_id=note_data.category_id,
             time=datetime.now(),
         )
         self.session.add(db_note)
-        self.session.commit()
+        self.counters.note_created(db_note)
+        self._save()
         self.session.refresh(db_note)
         return db_note
 
@@ -56,6 +93,27 @@ class NoteService:
         statement = select(Note).offset(offset).limit(limit)
         return self.session.exec(statement).all()
 
+    def get_notes_by_ids(self, note_ids: Sequence[int], for_update: bool = False) -> Sequence[Note]:
+        """
+        TEACHING: ONE QUERY INSTEAD OF N
+        'WHERE id IN (...)' fetches many notes in a single round trip instead
+        of calling 'get_note_by_id' once per id. Missing ids are simply absent.
+        With 'for_update=True' the notes are read under the write lock (see
+        '_get_note_for_write'), so nobody can change them until we commit.
+        """
+        statement = select(Note).where(col(Note.id).in_(note_ids))
+        if for_update:
+            begin_write(self.session)
+            statement = statement.with_for_update()
+        return self.session.exec(statement).all()
+
+    def count_notes(self, category_id: int | None = None, priority: int | None = None) -> int:
+        """
+        TEACHING: COUNTING WITHOUT COUNT(*)
+        Reads the maintained counter row instead of scanning the 'note' table.
+        """
+        return self.counters.get_count(category_id=category_id, priority=priority)
+
     def get_note_by_id(self, note_id: int) -> Note:
         """
         TEACHING: ERROR HANDLING
@@ -68,15 +126,32 @@ class NoteService:
             raise HTTPException(status_code=404, detail="Note not found")
         return note
 
+    def _get_note_for_write(self, note_id: int) -> Note:
+        """
+        TEACHING: LOCK, THEN READ
+        The counter deltas are computed from the note we read here, so nobody
+        else may change or delete it until we commit. 'begin_write' takes
+        SQLite's write lock and 'with_for_update()' locks the row on PostgreSQL
+        (SQLite ignores it). 'populate_existing' makes sure we use the row we
+        just read, not a copy this session loaded earlier.
+        """
+        begin_write(self.session)
+        statement = select(Note).where(Note.id == note_id).with_for_update()
+        note = self.session.exec(statement.execution_options(populate_existing=True)).first()
+        if not note:
+            raise HTTPException(status_code=404, detail="Note not found")
+        return note
+
     def update_note(self, note_id: int, note_data: NoteUpdate) -> Note:
         """
         TEACHING: PARTIAL UPDATES (PATCH)
-        1. Find the existing note first.
+        1. Find (and lock) the existing note first.
         2. 'model_dump(exclude_unset=True)' only returns the fields the user
            specifically sent. If they only sent a 'title', we only update that.
         3. 'setattr' updates the model attribute dynamically.
         """
-        db_note = self.get_note_by_id(note_id)
+        db_note = self._get_note_for_write(note_id)
+        old_buckets = (db_note.category_id, db_note.priority)
 
         # Update only the fields provided in the update schema
         update_dict = note_data.model_dump(exclude_unset=True)
@@ -87,7 +162,10 @@ class NoteService:
         db_note.time = datetime.now()
 
         self.session.add(db_note)
-        self.session.commit()
+        new_buckets = (db_note.category_id, db_note.priority)
+        if new_buckets != old_buckets:
+            self.counters.note_moved(old_buckets, new_buckets)
+        self._save()
         self.session.refresh(db_note)
         return db_note
 
@@ -95,12 +173,13 @@ class NoteService:
         """
         TEACHING: DELETION
         Deleting from a database is a two-step process in SQLModel:
-        1. Tell the session to delete the object.
+        1. Tell the session to delete the object (and decrement its counters).
         2. Commit the transaction to make the removal permanent.
         """
-        db_note = self.get_note_by_id(note_id)
+        db_note = self._get_note_for_write(note_id)
         self.session.delete(db_note)
-        self.session.commit()
+        self.counters.note_deleted(db_note)
+        self._save()
         return {
             "status": "success",
             "message": f"Note {note_id} deleted successfully",